@@ -17,29 +17,73 @@
 import os
 import time
 import json
-import urllib
 import yaml
+import shutil
 import hashlib
 import logging
 import httplib2
+import requests
 import google.auth
 import google.oauth2.id_token
 from threading import Lock
 from google.oauth2 import service_account
+from google.auth.transport.requests import AuthorizedSession
 from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 
 from lithops import utils
-from lithops.constants import COMPUTE_CLI_MSG
+from lithops.constants import COMPUTE_CLI_MSG, CACHE_DIR
 from lithops.version import __version__
 
 from . import config
 
+try:
+    import httpx
+    import h2  # noqa: F401 -- required by httpx for HTTP/2 support
+except ImportError:
+    httpx = None
+
 invoke_mutex = Lock()
 
 logger = logging.getLogger(__name__)
 
 
+class IDTokenHTTP2Session:
+    """
+    HTTP/2 client that authorizes each request with an ID token.
+    All concurrent invocations are multiplexed over a few connections
+    """
+
+    def __init__(self, credentials):
+        self.credentials = credentials
+        self.client = httpx.Client(
+            http2=True, timeout=None,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+        self._auth_req = google.auth.transport.requests.Request()
+        self._refresh_mutex = Lock()
+
+    def _refresh(self, token=None):
+        with self._refresh_mutex:
+            # Skip if another thread already replaced the rejected token
+            if not self.credentials.valid or self.credentials.token == token:
+                self.credentials.refresh(self._auth_req)
+
+    def post(self, url, data=None):
+        if not self.credentials.valid:
+            self._refresh()
+        token = self.credentials.token
+        res = self.client.post(url, content=data, headers={'Authorization': f'Bearer {token}'})
+
+        if res.status_code == 401:
+            # The token was rejected before its expiry, refresh it and retry once
+            self._refresh(token)
+            headers = {'Authorization': f'Bearer {self.credentials.token}'}
+            res = self.client.post(url, content=data, headers=headers)
+
+        return res
+
+
 class GCPCloudRunBackend:
 
     def __init__(self, cloudrun_config, internal_storage):
@@ -49,11 +93,25 @@ class GCPCloudRunBackend:
         self.region = cloudrun_config['region']
         self.trigger = cloudrun_config['trigger']
         self.credentials_path = cloudrun_config.get('credentials_path')
+        self.http2 = cloudrun_config.get('http2', False)
+
+        if self.http2 and httpx is None:
+            raise ModuleNotFoundError(
+                "Please install 'pip3 install httpx[http2]' for "
+                "making use of the 'http2' option")
+
+        self._sa_info = None
+        if self.credentials_path and os.path.isfile(self.credentials_path):
+            with open(self.credentials_path, 'r') as f:
+                self._sa_info = json.load(f)
+
+        self.cache_dir = os.path.join(CACHE_DIR, self.name)
 
         self._build_api_resource()
 
-        self._service_url = None
-        self._id_token = None
+        self._invoker_sess = {}
+        self._service_names = {}
+        self._image_names = {}
 
         msg = COMPUTE_CLI_MSG.format('Google Cloud Run')
         logger.info(f"{msg} - Region: {self.region} - Project: {self.project_name}")
@@ -62,10 +120,13 @@ class GCPCloudRunBackend:
         """
         Formats service name string from runtime name and memory
         """
-        name = f'{runtime_name}-{runtime_memory}-{version}-{self.trigger}-{self.region}'
-        name_hash = hashlib.sha1(name.encode("utf-8")).hexdigest()[:10]
+        key = (runtime_name, runtime_memory, version)
+        if key not in self._service_names:
+            name = f'{runtime_name}-{runtime_memory}-{version}-{self.trigger}-{self.region}'
+            name_hash = hashlib.sha1(name.encode("utf-8")).hexdigest()[:10]
+            self._service_names[key] = f'lithops-worker-{version.replace(".", "")}-{name_hash}'
 
-        return f'lithops-worker-{version.replace(".", "")}-{name_hash}'
+        return self._service_names[key]
 
     def _get_default_runtime_image_name(self):
         """
@@ -79,19 +140,22 @@ class GCPCloudRunBackend:
         """
         Formats GCR image name from runtime name
         """
-        if 'gcr.io' not in runtime_name:
-            country = self.region.split('-')[0]
-            return f'{country}.gcr.io/{self.project_name}/{runtime_name}'
-        else:
-            return runtime_name
+        if runtime_name not in self._image_names:
+            if 'gcr.io' not in runtime_name:
+                country = self.region.split('-')[0]
+                self._image_names[runtime_name] = f'{country}.gcr.io/{self.project_name}/{runtime_name}'
+            else:
+                self._image_names[runtime_name] = runtime_name
+
+        return self._image_names[runtime_name]
 
     def _build_api_resource(self):
         """
         Instantiate and authorize admin discovery API session
         """
-        if self.credentials_path and os.path.isfile(self.credentials_path):
+        if self._sa_info:
             logger.debug(f'Getting GCP credentials from {self.credentials_path}')
-            cred = service_account.Credentials.from_service_account_file(self.credentials_path, scopes=config.SCOPES)
+            cred = service_account.Credentials.from_service_account_info(self._sa_info, scopes=config.SCOPES)
             self.project_name = cred.project_id
             self.service_account = cred.service_account_email
         else:
@@ -99,43 +163,75 @@ class GCPCloudRunBackend:
             cred, self.project_name = google.auth.default(scopes=config.SCOPES)
             self.service_account = cred.service_account_email
 
+        self._api_endpoint = f'https://{self.region}-run.googleapis.com'
+
         http = AuthorizedHttp(cred, http=httplib2.Http())
         self._api_resource = build(
             'run', config.CLOUDRUN_API_VERSION,
             http=http, cache_discovery=False,
             client_options={
-                'api_endpoint': f'https://{self.region}-run.googleapis.com'
+                'api_endpoint': self._api_endpoint
             }
         )
+        self._api_services = self._api_resource.namespaces().services()
+
+        self._api_session = AuthorizedSession(cred)
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=20)
+        self._api_session.mount('https://', adapter)
 
         self.cr_config['project_name'] = self.project_name
         self.cr_config['service_account'] = self.service_account
 
-    def _get_url_and_token(self, service_name):
+    def _get_service(self, service_name):
         """
-        Generates a connection token
+        Gets a service description with a direct REST call over the pooled admin session
         """
-        invoke_mutex.acquire()
-        request_token = False
-
-        if not self._service_url or service_name not in self._service_url:
-            logger.debug('Getting service endpoint')
-            res = self._api_resource.namespaces().services().get(
-                name=f'namespaces/{self.project_name}/services/{service_name}'
-            ).execute()
-            self._service_url = res['status']['url']
-            request_token = True
-            logger.debug(f'Service endpoint url is {self._service_url}')
+        url = (f'{self._api_endpoint}/apis/serving.knative.dev/{config.CLOUDRUN_API_VERSION}'
+               f'/namespaces/{self.project_name}/services/{service_name}')
+        res = self._api_session.get(url)
+        res.raise_for_status()
 
-        if not self._id_token or request_token:
-            logger.debug('Getting authentication token')
-            if self.credentials_path and os.path.isfile(self.credentials_path):
-                os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = self.credentials_path
-            auth_req = google.auth.transport.requests.Request()
-            self._id_token = google.oauth2.id_token.fetch_id_token(auth_req, self._service_url)
-        invoke_mutex.release()
+        return res.json()
 
-        return self._service_url, self._id_token
+    def _get_invoker_sess(self, service_name):
+        """
+        Returns the service endpoint and an authorized invoker session for it.
+        The session is created once per service, and its ID token credentials
+        are refreshed automatically when they expire
+        """
+        if service_name in self._invoker_sess:
+            return self._invoker_sess[service_name]
+
+        with invoke_mutex:
+            if service_name not in self._invoker_sess:
+                logger.debug('Getting service endpoint')
+                res = self._get_service(service_name)
+                service_url = res['status']['url']
+                logger.debug(f'Service endpoint url is {service_url}')
+
+                logger.debug('Getting authentication token')
+                if self._sa_info:
+                    id_token_cred = service_account.IDTokenCredentials.from_service_account_info(
+                        self._sa_info, target_audience=service_url
+                    )
+                else:
+                    auth_req = google.auth.transport.requests.Request()
+                    id_token_cred = google.oauth2.id_token.fetch_id_token_credentials(
+                        service_url, request=auth_req
+                    )
+
+                if self.http2:
+                    logger.debug('Using HTTP/2 transport for invocations')
+                    sess = IDTokenHTTP2Session(id_token_cred)
+                else:
+                    sess = AuthorizedSession(id_token_cred)
+                    pool_size = max(128, self.cr_config['invoke_pool_threads'])
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=64, pool_maxsize=pool_size)
+                    sess.mount('https://', adapter)
+
+                self._invoker_sess[service_name] = (service_url, sess)
+
+        return self._invoker_sess[service_name]
 
     def _build_default_runtime(self, runtime_name):
         """
@@ -152,10 +248,44 @@ class GCPCloudRunBackend:
         finally:
             os.remove(dockerfile)
 
+    def _get_runtime_meta_file(self, runtime_name, runtime_memory):
+        """
+        Returns the local cache file of the runtime metadata, keyed by the
+        digest of the image deployed in the ready revision of the service.
+        Returns None if the digest is not available
+        """
+        img_name = self._format_image_name(runtime_name)
+        service_name = self._format_service_name(img_name, runtime_memory)
+
+        try:
+            svc = self._get_service(service_name)
+            revision = svc['status']['latestReadyRevisionName']
+            url = (f'{self._api_endpoint}/apis/serving.knative.dev/{config.CLOUDRUN_API_VERSION}'
+                   f'/namespaces/{self.project_name}/revisions/{revision}')
+            res = self._api_session.get(url)
+            res.raise_for_status()
+            image_digest = res.json()['status']['imageDigest']
+        except Exception as e:
+            logger.debug(f'Unable to get the image digest of {service_name}: {e}')
+            return None
+
+        digest = image_digest.split('@')[-1].replace('sha256:', '')
+        return os.path.join(self.cache_dir, 'runtime_meta', f'{digest}.json')
+
     def _generate_runtime_meta(self, runtime_name, runtime_memory):
         """
         Extract installed Python modules from docker image
         """
+        meta_file = self._get_runtime_meta_file(runtime_name, runtime_memory)
+        if meta_file and os.path.isfile(meta_file):
+            try:
+                with open(meta_file, 'r') as f:
+                    runtime_meta = json.load(f)
+                logger.debug(f'Runtime metadata of {runtime_name} found in local disk cache')
+                return runtime_meta
+            except Exception:
+                os.remove(meta_file)
+
         logger.info(f"Extracting metadata from: {runtime_name}")
 
         try:
@@ -170,6 +300,16 @@ class GCPCloudRunBackend:
         if not runtime_meta or 'preinstalls' not in runtime_meta:
             raise Exception(f'Failed getting runtime metadata: {runtime_meta}')
 
+        if meta_file:
+            try:
+                os.makedirs(os.path.dirname(meta_file), exist_ok=True)
+                tmp_file = f'{meta_file}.{os.getpid()}.tmp'
+                with open(tmp_file, 'w') as f:
+                    json.dump(runtime_meta, f)
+                os.replace(tmp_file, meta_file)
+            except Exception as e:
+                logger.debug(f'Could not save runtime metadata to local cache: {e}')
+
         logger.debug(f'Ok -- Extraced modules from {runtime_name}')
         return runtime_meta
 
@@ -184,7 +324,7 @@ class GCPCloudRunBackend:
 
         img_name = self._format_image_name(runtime_name)
         service_name = self._format_service_name(img_name, runtime_memory)
-        service_url, id_token = self._get_url_and_token(service_name)
+        service_url, sess = self._get_invoker_sess(service_name)
 
         if exec_id and job_id and call_id:
             logger.debug(f'ExecutorID {exec_id} | JobID {job_id} - Invoking function call {call_id}')
@@ -193,15 +333,17 @@ class GCPCloudRunBackend:
         else:
             logger.debug('Invoking function')
 
-        req = urllib.request.Request(service_url + route, data=json.dumps(payload, default=str).encode('utf-8'))
-        req.add_header("Authorization", f"Bearer {id_token}")
-        res = urllib.request.urlopen(req)
+        res = sess.post(service_url + route, data=json.dumps(payload, default=str))
 
-        if res.getcode() in (200, 202):
-            data = json.loads(res.read())
+        if res.status_code in (200, 202):
+            data = res.json()
             if return_result:
                 return data
             return data["activationId"]
+        elif res.status_code == 429 and not return_result:
+            # No container instance available, let the invoker retry the call
+            time.sleep(0.2)
+            return None
         else:
             raise Exception(res.text)
 
@@ -231,11 +373,11 @@ class GCPCloudRunBackend:
 
         logger.debug('Authorizing Docker client with GCR permissions')
         country = self.region.split('-')[0]
-        cmd = f'cat {self.credentials_path} | {docker_path} login {country}.gcr.io -u _json_key --password-stdin'
-        if logger.getEffectiveLevel() != logging.DEBUG:
-            cmd = cmd + f" >{os.devnull} 2>&1"
-        res = os.system(cmd)
-        if res != 0:
+        cmd = f'{docker_path} login {country}.gcr.io -u _json_key --password-stdin'
+        try:
+            with open(self.credentials_path, 'r') as f:
+                utils.run_command(cmd, input=f.read())
+        except Exception:
             raise Exception('There was an error authorizing Docker for push to GCR')
 
         logger.debug(f'Pushing runtime {image_name} to GCP Container Registry')
@@ -278,32 +420,28 @@ class GCPCloudRunBackend:
         container['resources']['requests']['cpu'] = str(self.cr_config['runtime_cpu'])
 
         logger.debug(f"Creating service: {service_name}")
-        res = self._api_resource.namespaces().services().create(
+        res = self._api_services.create(
             parent=f'namespaces/{self.project_name}', body=svc_res
         ).execute()
         logger.debug(f'Ok -- service created {service_name}')
 
         # Wait until service is up
         ready = False
-        retry = 15
+        start = time.time()
+        backoff = utils.poll_backoff(base=1, cap=10)
         logger.debug(f'Waiting {service_name} service to become ready')
         while not ready:
-            res = self._api_resource.namespaces().services().get(
-                name=f'namespaces/{self.project_name}/services/{service_name}'
-            ).execute()
+            res = self._get_service(service_name)
 
             ready = all(cond['status'] == 'True' for cond in res['status']['conditions'])
 
             if not ready:
+                if time.time() - start > config.SERVICE_READY_TIMEOUT:
+                    raise Exception(f'Readiness probe expired on service {service_name}: {res}')
                 logger.debug('...')
-                time.sleep(10)
-                retry -= 1
-                if retry == 0:
-                    raise Exception(f'Maximum retries reached: {res}')
-            else:
-                self._service_url = res['status']['url']
+                time.sleep(next(backoff))
 
-        logger.debug(f'Ok -- service is up at {self._service_url}')
+        logger.debug(f"Ok -- service is up at {res['status']['url']}")
 
     def deploy_runtime(self, runtime_name, memory, timeout):
         if runtime_name == self._get_default_runtime_image_name():
@@ -323,17 +461,17 @@ class GCPCloudRunBackend:
 
     def _delete_service(self, service_name):
         logger.debug(f'Deleting service {service_name}')
+        self._invoker_sess.pop(service_name, None)
         try:
-            self._api_resource.namespaces().services().delete(
+            self._api_services.delete(
                 name=f'namespaces/{self.project_name}/services/{service_name}'
             ).execute()
             # Wait until the service is completely deleted
+            backoff = utils.poll_backoff(cap=4)
             while True:
                 try:
-                    self._api_resource.namespaces().services().get(
-                        name=f'namespaces/{self.project_name}/services/{service_name}'
-                    ).execute()
-                    time.sleep(1)
+                    self._get_service(service_name)
+                    time.sleep(next(backoff))
                 except Exception:
                     break
             logger.debug(f'Ok -- service deleted {service_name}')
@@ -342,8 +480,9 @@ class GCPCloudRunBackend:
 
     def clean(self, **kwargs):
         logger.debug('Going to delete all deployed runtimes')
+        shutil.rmtree(os.path.join(self.cache_dir, 'runtime_meta'), ignore_errors=True)
 
-        res = self._api_resource.namespaces().services().list(
+        res = self._api_services.list(
             parent=f'namespaces/{self.project_name}',
         ).execute()
 
@@ -362,7 +501,7 @@ class GCPCloudRunBackend:
     def list_runtimes(self, runtime_name='all'):
         logger.debug('Listing runtimes')
 
-        res = self._api_resource.namespaces().services().list(
+        res = self._api_services.list(
             parent=f'namespaces/{self.project_name}',
         ).execute()
 
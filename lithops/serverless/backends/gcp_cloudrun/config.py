@@ -32,12 +32,15 @@ DEFAULT_CONFIG_KEYS = {
     'worker_processes': 1,
     'invoke_pool_threads': 100,
     'trigger': 'https',
+    'http2': False,
     'docker_server': 'gcr.io'
 }
 
 MAX_RUNTIME_MEMORY = 32768  # 32 GiB
 MAX_RUNTIME_TIMEOUT = 3600  # 1 hour
 
+SERVICE_READY_TIMEOUT = 150  # 2.5 minutes
+
 AVAILABLE_RUNTIME_CPUS = [x / 100.0 for x in range(8, 100)] + [1, 2, 4, 6, 8]
 
 FH_ZIP_LOCATION = os.path.join(os.getcwd(), 'lithops_cloudrun.zip')
@@ -62,7 +65,6 @@ RUN pip install --upgrade --ignore-installed setuptools six pip \
         cloudpickle \
         ps-mem \
         tblib \
-        namegenerator \
         cryptography \
         httplib2 \
         google-cloud-storage \
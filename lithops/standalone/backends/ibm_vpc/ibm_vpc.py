@@ -20,16 +20,23 @@ import os
 import time
 import logging
 import uuid
+import hashlib
 import functools
 import inspect
 from datetime import datetime
+from urllib.parse import urlparse, parse_qs
+from urllib3.util.retry import Retry
+from threading import Lock
 from ibm_vpc import VpcV1
-from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
+from ibm_cloud_sdk_core.authenticators import Authenticator, IAMAuthenticator
 from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.http_adapter import SSLHTTPAdapter
 from concurrent.futures import ThreadPoolExecutor
 
 from lithops.version import __version__
+from lithops.utils import poll_backoff
 from lithops.util.ssh_client import SSHClient
+from lithops.util.ibm_token_manager import IAMTokenManager
 from lithops.constants import COMPUTE_CLI_MSG, CACHE_DIR
 from lithops.config import load_yaml_config, dump_yaml_config
 from lithops.standalone.utils import (
@@ -78,9 +85,9 @@ class IBMVPCBackend:
         self.workers = []
 
         self.iam_api_key = self.config.get('iam_api_key')
-        authenticator = IAMAuthenticator(self.iam_api_key, url=self.config.get('iam_endpoint'))
-        self.vpc_cli = VpcV1(VPC_API_VERSION, authenticator=authenticator)
+        self.vpc_cli = VpcV1(VPC_API_VERSION, authenticator=create_authenticator(self.config))
         self.vpc_cli.set_service_url(self.config['endpoint'] + '/v1')
+        set_http_adapter(self.vpc_cli)
 
         user_agent_string = f"ibm_vpc_{self.config['user_agent']}"
         self.vpc_cli._set_user_agent_header(user_agent_string)
@@ -352,11 +359,14 @@ class IBMVPCBackend:
         """
         fip_data = None
 
-        floating_ips_info = self.vpc_cli.list_floating_ips().get_result()
+        floating_ips_info = self.vpc_cli.list_floating_ips(
+            resource_group_id=self.config['resource_group_id']
+        ).get_result()
         for fip in floating_ips_info['floating_ips']:
             if fip['name'].startswith("lithops-recyclable") and 'target' not in fip \
                and fip['zone']['name'] == self.config['zone_name']:
                 fip_data = fip
+                break
 
         if not fip_data:
             floating_ip_name = f'lithops-recyclable-{str(uuid.uuid4())[-4:]}'
@@ -402,25 +412,22 @@ class IBMVPCBackend:
             self.config['image_id'] = self.vpc_data['image_id']
             return
 
-        images_def = self.vpc_cli.list_images().result['images']
-        images_user = self.vpc_cli.list_images(resource_group_id=self.config['resource_group_id']).result['images']
-        images_def.extend(images_user)
-
         if 'image_id' in self.vpc_data:
-            for image in images_def:
-                if image['id'] == self.vpc_data['image_id'] and \
-                   not image['name'].startswith('ibm-ubuntu-22'):
+            try:
+                image = self.vpc_cli.get_image(self.vpc_data['image_id']).get_result()
+                if not image['name'].startswith('ibm-ubuntu-22'):
                     self.config['image_id'] = self.vpc_data['image_id']
-                    break
+            except ApiException:
+                pass
 
         if 'image_id' not in self.config:
-            for image in images_def:
-                if image['name'] == DEFAULT_LITHOPS_IMAGE_NAME:
-                    logger.debug(f"Found default VM image: {DEFAULT_LITHOPS_IMAGE_NAME}")
-                    self.config['image_id'] = image['id']
-                    break
+            images = self.vpc_cli.list_images(name=DEFAULT_LITHOPS_IMAGE_NAME).result['images']
+            if images:
+                logger.debug(f"Found default VM image: {DEFAULT_LITHOPS_IMAGE_NAME}")
+                self.config['image_id'] = images[0]['id']
 
         if 'image_id' not in self.config:
+            images_def = self.vpc_cli.list_images(visibility='public').result['images']
             for image in images_def:
                 if image['name'].startswith('ibm-ubuntu-22') \
                    and "amd64" in image['name']:
@@ -670,12 +677,18 @@ class IBMVPCBackend:
 
         def get_instances():
             instances = set()
-            instances_info = self.vpc_cli.list_instances().get_result()
-            for ins in instances_info['instances']:
-                if ins['name'].startswith(vms_prefixes) \
-                   and ins['vpc']['id'] == self.vpc_data['vpc_id']:
-                    instances.add((ins['name'], ins['id']))
-            return instances
+            start = None
+            while True:
+                instances_info = self.vpc_cli.list_instances(
+                    vpc_id=self.vpc_data['vpc_id'], limit=100, start=start
+                ).get_result()
+                for ins in instances_info['instances']:
+                    if ins['name'].startswith(vms_prefixes):
+                        instances.add((ins['name'], ins['id']))
+                next_href = instances_info.get('next', {}).get('href')
+                if not next_href:
+                    return instances
+                start = parse_qs(urlparse(next_href).query)['start'][0]
 
         deleted_instances = set()
         while True:
@@ -685,7 +698,7 @@ class IBMVPCBackend:
                     instances_to_delete.add(ins_to_delete)
 
             if instances_to_delete:
-                with ThreadPoolExecutor(len(instances_to_delete)) as executor:
+                with ThreadPoolExecutor(min(len(instances_to_delete), 48)) as executor:
                     executor.map(delete_instance, instances_to_delete)
                 deleted_instances.update(instances_to_delete)
             else:
@@ -699,8 +712,9 @@ class IBMVPCBackend:
             return
 
         # Wait until all instances are deleted
+        backoff = poll_backoff(base=1)
         while get_instances():
-            time.sleep(1)
+            time.sleep(next(backoff))
 
     def _delete_subnet(self):
         """
@@ -925,12 +939,12 @@ class IBMVPCInstance:
         """
         Creates an IBM VPC python-sdk instance
         """
-        authenticator = IAMAuthenticator(self.config.get('iam_api_key'), url=self.config.get('iam_endpoint'))
-        ibm_vpc_client = VpcV1(VPC_API_VERSION, authenticator=authenticator)
+        ibm_vpc_client = VpcV1(VPC_API_VERSION, authenticator=create_authenticator(self.config))
         ibm_vpc_client.set_service_url(self.config['endpoint'] + '/v1')
+        set_http_adapter(ibm_vpc_client)
 
         # decorate instance public methods with except/retry logic
-        decorate_instance(self.vpc_cli, vpc_retry_on_except)
+        decorate_instance(ibm_vpc_client, vpc_retry_on_except)
 
         return ibm_vpc_client
 
@@ -981,6 +995,7 @@ class IBMVPCInstance:
         logger.debug(f'Waiting {self} to become ready')
 
         start = time.time()
+        backoff = poll_backoff(base=1, cap=5)
 
         self.get_public_ip() if self.public else self.get_private_ip()
 
@@ -989,7 +1004,7 @@ class IBMVPCInstance:
                 start_time = round(time.time() - start, 2)
                 logger.debug(f'{self} ready in {start_time} seconds')
                 return True
-            time.sleep(5)
+            time.sleep(next(backoff))
 
         raise TimeoutError(f'Readiness probe expired on {self}')
 
@@ -1106,13 +1121,14 @@ class IBMVPCInstance:
         if not self.private_ip and self.instance_data:
             self.private_ip = self.instance_data['primary_network_interface']['primary_ipv4_address']
 
+        backoff = poll_backoff(cap=4)
         while not self.private_ip or self.private_ip == '0.0.0.0':
             instance_data = self.get_instance_data()
             private_ip = instance_data['primary_network_interface']['primary_ipv4_address']
             if private_ip != '0.0.0.0':
                 self.private_ip = private_ip
             else:
-                time.sleep(1)
+                time.sleep(next(backoff))
 
         return self.private_ip
 
@@ -1184,7 +1200,11 @@ class IBMVPCInstance:
         """
         Checks if the VM instance is stoped
         """
-        data = self.get_instance_data()
+        if self.instance_id:
+            self.instance_data = self.vpc_cli.get_instance(self.instance_id).get_result()
+            data = self.instance_data
+        else:
+            data = self.get_instance_data()
         if data['status'] == 'stopped':
             return True
         return False
@@ -1196,11 +1216,12 @@ class IBMVPCInstance:
         logger.debug(f'Waiting {self} to become stopped')
 
         start = time.time()
+        backoff = poll_backoff(base=2, cap=8)
 
         while (time.time() - start < timeout):
             if self.is_stopped():
                 return True
-            time.sleep(3)
+            time.sleep(next(backoff))
 
         raise TimeoutError(f'Stop probe expired on {self}')
 
@@ -1275,6 +1296,86 @@ RETRIABLE = ['list_vpcs',
              'delete_instance']
 
 
+class VPCIAMTokenManager(IAMTokenManager):
+    """
+    IAM token manager whose local cache file is bound to the API key,
+    so a token generated for another key is never reused
+    """
+
+    def __init__(self, ibm_api_key):
+        key_hash = hashlib.sha256(ibm_api_key.encode('utf-8')).hexdigest()[:16]
+        self.TOEKN_FILE = os.path.join(CACHE_DIR, 'ibm_vpc', f'iam_token_{key_hash}')
+        super().__init__(ibm_api_key)
+
+
+class CachedIAMAuthenticator(Authenticator):
+    """
+    Authenticates the VPC requests with the IAM token from the local
+    Lithops token cache. The bearer token is kept in memory and only
+    requested again to the token manager when it is about to expire
+    """
+
+    def __init__(self, iam_api_key):
+        self.token_manager = VPCIAMTokenManager(iam_api_key)
+        self.token, self.expiry_time = self.token_manager.get_token()
+        self._lock = Lock()
+
+    def refresh(self, token):
+        """
+        Forces a new token after the given one was rejected
+        """
+        with self._lock:
+            # Skip if another thread already replaced the rejected token
+            if self.token == token:
+                self.token, self.expiry_time = self.token_manager.refresh_token()
+
+    def authentication_type(self):
+        return Authenticator.AUTHTYPE_IAM
+
+    def validate(self):
+        if not self.token_manager.ibm_api_key:
+            raise ValueError('The IAM API key must be provided')
+
+    def authenticate(self, req):
+        if time.time() >= self.expiry_time - 30:
+            with self._lock:
+                if time.time() >= self.expiry_time - 30:
+                    self.token, self.expiry_time = self.token_manager.get_token()
+        req['headers']['Authorization'] = f'Bearer {self.token}'
+
+
+def create_authenticator(ibm_vpc_config):
+    """
+    Creates the authenticator of the VPC python-sdk client
+    """
+    if ibm_vpc_config.get('iam_endpoint'):
+        # The Lithops token cache only works with the public IAM endpoint
+        return IAMAuthenticator(ibm_vpc_config['iam_api_key'], url=ibm_vpc_config['iam_endpoint'])
+
+    return CachedIAMAuthenticator(ibm_vpc_config['iam_api_key'])
+
+
+def set_http_adapter(ibm_vpc_client):
+    """
+    Mounts a pooled SSL adapter on the http client of a VPC python-sdk client
+    """
+    # Only idempotent requests are retried here. Create/action POSTs are
+    # retried by vpc_retry_on_except, which handles 'already exists' errors
+    retries = Retry(
+        total=3, backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'DELETE']),
+        raise_on_status=False
+    )
+    adapter = SSLHTTPAdapter(
+        pool_connections=50, pool_maxsize=100, max_retries=retries,
+        _disable_ssl_verification=ibm_vpc_client.disable_ssl_verification
+    )
+    ibm_vpc_client.http_adapter = adapter
+    ibm_vpc_client.http_client.mount('http://', adapter)
+    ibm_vpc_client.http_client.mount('https://', adapter)
+
+
 def decorate_instance(instance, decorator):
     for name, func in inspect.getmembers(instance, inspect.ismethod):
         if name in RETRIABLE:
@@ -1303,10 +1404,16 @@ def vpc_retry_on_except(func):
                 raise err
 
         for i in range(RETRIES):
+            authenticator = func.__self__.get_authenticator()
+            token = getattr(authenticator, 'token', None)
             try:
                 return func(*args, **kwargs)
             except ApiException as err:
-                if func.__name__ in IGNORED_404_METHODS and err.code == 404:
+                if err.code == 401 and isinstance(authenticator, CachedIAMAuthenticator):
+                    # The cached token was rejected, force a new one before retrying
+                    authenticator.refresh(token)
+                    sleep_time = _sleep_or_raise(sleep_time, err)
+                elif func.__name__ in IGNORED_404_METHODS and err.code == 404:
                     # logger.debug((f'Got exception {err} when trying to invoke {func.__name__}, ignoring'))
                     pass
                 else:
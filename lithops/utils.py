@@ -21,6 +21,7 @@ import os
 import sys
 import uuid
 import json
+import random
 import socket
 import shutil
 import base64
@@ -41,6 +42,8 @@ from lithops.version import __version__
 
 logger = logging.getLogger(__name__)
 
+RUNTIME_NAME_RE = re.compile(r'^[A-Za-z0-9_/.:-]*$')
+
 
 def uuid_str():
     return str(uuid.uuid4())
@@ -256,10 +259,18 @@ def create_handler_zip(dst_zip_location, entry_point_files, entry_point_name=Non
 
 def verify_runtime_name(runtime_name):
     """Check if the runtime name has a correct formating"""
-    assert re.match("^[A-Za-z0-9_/.:-]*$", runtime_name), \
+    assert RUNTIME_NAME_RE.match(runtime_name), \
         f'Runtime name "{runtime_name}" not valid'
 
 
+def poll_backoff(base=0.5, cap=8.0, factor=2.0, jitter=0.2):
+    """Yields exponentially increasing polling intervals, capped and with jitter"""
+    interval = base
+    while True:
+        yield interval * (1 + random.uniform(-jitter, jitter))
+        interval = min(cap, interval * factor)
+
+
 def timeout_handler(error_msg, signum, frame):
     raise TimeoutError(error_msg)
 